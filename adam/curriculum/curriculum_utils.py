@@ -1,10 +1,11 @@
+from functools import lru_cache
 from random import Random
 
 from typing import Iterable, Union, Optional, Sequence, List, Tuple, Any
 
 from adam.axes import HorizontalAxisOfObject, FacingAddresseeAxis
 from adam.ontology import IS_SPEAKER, IS_ADDRESSEE
-from immutablecollections import immutableset
+from immutablecollections import ImmutableSet, immutableset
 from adam.language.language_generator import LanguageGenerator
 from adam.language.dependency import LinearizedDependencyTree
 from adam.curriculum import InstanceGroup, GeneratedFromSituationsInstanceGroup
@@ -163,13 +164,24 @@ def make_noise_objects(
     noise_objects: Optional[int],
     banned_ontology_types: Iterable[OntologyNode] = immutableset(),
 ) -> Iterable[TemplateObjectVariable]:
+    return _make_noise_objects(
+        noise_objects if noise_objects else 0, immutableset(banned_ontology_types)
+    )
+
+
+# Template variables are immutable, so the same noise objects can safely be shared
+# by every curriculum which asks for the same number of them.
+@lru_cache(maxsize=None)
+def _make_noise_objects(
+    num_noise_objects: int, banned_ontology_types: ImmutableSet[OntologyNode]
+) -> ImmutableSet[TemplateObjectVariable]:
     return immutableset(
         standard_object(
             f"noise_object_{x}",
             banned_properties=[IS_SPEAKER, IS_ADDRESSEE],
             banned_ontology_types=banned_ontology_types,
         )
-        for x in range(noise_objects if noise_objects else 0)
+        for x in range(num_noise_objects)
     )
 
 
@@ -1,5 +1,5 @@
 from immutablecollections import immutableset
-from itertools import chain
+from itertools import chain, product
 from typing import Iterable, Sequence, Optional
 from adam.language.language_generator import LanguageGenerator
 from adam.situation.high_level_semantics_situation import HighLevelSemanticsSituation
@@ -107,6 +107,7 @@ from adam.situation.templates.phase1_templates import (
 )
 
 BOOL_SET = immutableset([True, False])
+BOOL_PAIRS = tuple(product(BOOL_SET, repeat=2))
 
 # TODO: fix https://github.com/isi-vista/adam/issues/917 which causes us to have to specify that we don't wish to include ME_HACK and YOU_HACK in our curriculum design
 # PUSH templates
@@ -846,6 +847,7 @@ def _throw_beside_template(
     *,
     is_right: bool,
 ) -> Phase1SituationTemplate:
+    goal_region = Region(goal_reference, distance=PROXIMAL)
     return Phase1SituationTemplate(
         f"{agent.handle}-throws-{theme.handle}-beside-{goal_reference.handle}",
         salient_object_variables=[agent, theme, goal_reference],
@@ -856,7 +858,7 @@ def _throw_beside_template(
                 argument_roles_to_fillers=[
                     (AGENT, agent),
                     (THEME, theme),
-                    (GOAL, Region(goal_reference, distance=PROXIMAL)),
+                    (GOAL, goal_region),
                 ],
                 during=DuringAction(
                     objects_to_paths=[
@@ -865,9 +867,7 @@ def _throw_beside_template(
                             SpatialPath(
                                 TO,
                                 reference_source_object=agent,
-                                reference_destination_object=Region(
-                                    goal_reference, distance=PROXIMAL
-                                ),
+                                reference_destination_object=goal_region,
                                 properties=[SIDE, RIGHT if is_right else LEFT],
                             ),
                         )
@@ -1069,6 +1069,7 @@ def _throw_towards_away_template(
     *,
     is_towards: bool,
 ) -> Phase1SituationTemplate:
+    goal_region = Region(spatial_reference, distance=PROXIMAL if is_towards else DISTAL)
     return Phase1SituationTemplate(
         f"{agent.handle}-throws-{theme.handle}-toward/away_from-{spatial_reference.handle}",
         salient_object_variables=[agent, theme, spatial_reference],
@@ -1077,14 +1078,7 @@ def _throw_towards_away_template(
             Action(
                 THROW,
                 argument_roles_to_fillers=[(AGENT, agent), (THEME, theme)],
-                auxiliary_variable_bindings=[
-                    (
-                        THROW_GOAL,
-                        Region(
-                            spatial_reference, distance=PROXIMAL if is_towards else DISTAL
-                        ),
-                    )
-                ],
+                auxiliary_variable_bindings=[(THROW_GOAL, goal_region)],
                 during=DuringAction(
                     objects_to_paths=[
                         (
@@ -1095,10 +1089,7 @@ def _throw_towards_away_template(
                                     spatial_reference,
                                     distance=DISTAL if is_towards else PROXIMAL,
                                 ),
-                                reference_destination_object=Region(
-                                    spatial_reference,
-                                    distance=PROXIMAL if is_towards else DISTAL,
-                                ),
+                                reference_destination_object=goal_region,
                                 reference_axis=HorizontalAxisOfObject(theme, 1),
                             ),
                         )
@@ -2905,8 +2896,7 @@ def _make_push_with_prepositions(
                         max_to_sample=num_samples if num_samples else 5,
                         block_multiple_of_the_same_type=True,
                     )
-                    for is_ending_proximal in BOOL_SET
-                    for is_towards in BOOL_SET
+                    for is_ending_proximal, is_towards in BOOL_PAIRS
                 ]
             ),
             # Out
@@ -4022,232 +4012,72 @@ def _make_throw_with_prepositions(
     implicit_goal_reference = standard_object("goal_reference", INANIMATE_OBJECT)
     background = make_noise_objects(noise_objects)
     situation_templates = [
+        # to, in, on, to recipient
         _throw_to_template(agent, theme, goal_reference, background),
         _throw_in_template(agent, theme, goal_in, background),
         _throw_on_template(agent, theme, goal_on, background),
         _x_throws_y_to_z_template(thrower, theme, recipient, background),
     ]
-
+    # beside
+    situation_templates.extend(
+        _throw_beside_template(
+            agent, theme, goal_reference, background, is_right=is_right
+        )
+        for is_right in BOOL_SET
+    )
+    # in front of, behind
+    situation_templates.extend(
+        _throw_in_front_of_behind_template(
+            agent, theme, goal_reference, background, is_in_front=is_in_front
+        )
+        for is_in_front in BOOL_SET
+    )
     if use_path_instead_of_goal:
-        return phase1_instances(
-            "Throw + PP",
-            chain(
-                # to, in, on, to recipient
-                flatten(
-                    [
-                        sampled(
-                            template,
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for template in situation_templates
-                    ]
-                ),
-                # beside
-                flatten(
-                    [
-                        sampled(
-                            _throw_beside_template(
-                                agent,
-                                theme,
-                                goal_reference,
-                                background,
-                                is_right=is_right,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for is_right in BOOL_SET
-                    ]
-                ),
-                # in front of, behind
-                flatten(
-                    [
-                        sampled(
-                            _throw_in_front_of_behind_template(
-                                agent,
-                                theme,
-                                goal_reference,
-                                background,
-                                is_in_front=is_in_front,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for is_in_front in BOOL_SET
-                    ]
-                ),
+        situation_templates.extend(
+            [
                 # path over
-                flatten(
-                    [
-                        sampled(
-                            _throw_path_over_template(
-                                agent,
-                                theme,
-                                goal_reference,
-                                implicit_goal_reference,
-                                background,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                    ]
+                _throw_path_over_template(
+                    agent, theme, goal_reference, implicit_goal_reference, background
                 ),
                 # path under -- currently disabled since we can't learn multiple semantics for one linguistic template
-                flatten(
-                    [
-                        sampled(
-                            _throw_path_under_template(
-                                agent,
-                                theme,
-                                goal_under,
-                                implicit_goal_reference,
-                                background,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                    ]
-                ),
-                # Towards & Away
-                flatten(
-                    [
-                        sampled(
-                            _throw_towards_away_template(
-                                agent,
-                                theme,
-                                goal_reference,
-                                background,
-                                is_towards=is_towards,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for is_towards in BOOL_SET
-                    ]
+                _throw_path_under_template(
+                    agent, theme, goal_under, implicit_goal_reference, background
                 ),
-            ),
-            language_generator=language_generator,
+            ]
         )
     else:
-        return phase1_instances(
-            "Throw + PP",
-            chain(
-                # to, in, on, to recipient
-                flatten(
-                    [
-                        sampled(
-                            template,
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for template in situation_templates
-                    ]
-                ),
-                # beside
-                flatten(
-                    [
-                        sampled(
-                            _throw_beside_template(
-                                agent,
-                                theme,
-                                goal_reference,
-                                background,
-                                is_right=is_right,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for is_right in BOOL_SET
-                    ]
-                ),
-                # in front of, behind
-                flatten(
-                    [
-                        sampled(
-                            _throw_in_front_of_behind_template(
-                                agent,
-                                theme,
-                                goal_reference,
-                                background,
-                                is_in_front=is_in_front,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for is_in_front in BOOL_SET
-                    ]
-                ),
+        situation_templates.extend(
+            [
                 # under
-                flatten(
-                    [
-                        sampled(
-                            _throw_under_template(agent, theme, goal_under, background),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                    ]
-                ),
+                _throw_under_template(agent, theme, goal_under, background),
                 # path over
-                flatten(
-                    [
-                        sampled(
-                            _throw_path_over_template(
-                                agent,
-                                theme,
-                                goal_reference,
-                                implicit_goal_reference,
-                                background,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                    ]
+                _throw_path_over_template(
+                    agent, theme, goal_reference, implicit_goal_reference, background
                 ),
-                # Towards & Away
-                flatten(
-                    [
-                        sampled(
-                            _throw_towards_away_template(
-                                agent,
-                                theme,
-                                goal_reference,
-                                background,
-                                is_towards=is_towards,
-                            ),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            max_to_sample=num_samples if num_samples else 5,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for is_towards in BOOL_SET
-                    ]
-                ),
-            ),
-            language_generator=language_generator,
+            ]
         )
+    # Towards & Away
+    situation_templates.extend(
+        _throw_towards_away_template(
+            agent, theme, goal_reference, background, is_towards=is_towards
+        )
+        for is_towards in BOOL_SET
+    )
+
+    return phase1_instances(
+        "Throw + PP",
+        chain.from_iterable(
+            sampled(
+                template,
+                ontology=GAILA_PHASE_1_ONTOLOGY,
+                chooser=PHASE1_CHOOSER_FACTORY(),
+                max_to_sample=num_samples if num_samples else 5,
+                block_multiple_of_the_same_type=True,
+            )
+            for template in situation_templates
+        ),
+        language_generator=language_generator,
+    )
 
 
 def _make_jump_with_prepositions(
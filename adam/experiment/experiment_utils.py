@@ -220,6 +220,9 @@ def build_object_learner_factory(
             smoothing_parameter=params.floating_point("smoothing_parameter"),
             ontology=ontology,
             language_mode=language_mode,
+            max_hypotheses_per_item=params.optional_positive_integer(
+                "max_hypotheses_per_item"
+            ),
         )
     elif learner_type == "recognizer":
         object_recognizer = ObjectRecognizer.for_ontology_types(
@@ -265,6 +268,9 @@ def build_attribute_learner_factory(
             smoothing_parameter=params.floating_point("smoothing_parameter"),
             ontology=ontology,
             language_mode=language_mode,
+            max_hypotheses_per_item=params.optional_positive_integer(
+                "max_hypotheses_per_item"
+            ),
         )
     elif learner_type == "none":
         # We don't want to include this learner type.
@@ -302,6 +308,9 @@ def build_relation_learner_factory(
             smoothing_parameter=params.floating_point("smoothing_parameter"),
             ontology=ontology,
             language_mode=language_mode,
+            max_hypotheses_per_item=params.optional_positive_integer(
+                "max_hypotheses_per_item"
+            ),
         )
     elif learner_type == "none":
         # We don't want to include this learner type.
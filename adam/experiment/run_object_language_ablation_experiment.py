@@ -1,6 +1,7 @@
-from typing import Any, Dict, Tuple, List
+from itertools import product
+from typing import Any, Mapping, Sequence, Tuple
 
-import numpy as np
+from immutablecollections import immutabledict
 
 from vistautils.parameters import Parameters
 
@@ -15,11 +16,14 @@ from pegasus_wrapper import (
 from pegasus_wrapper.resource_request import SlurmResourceRequest
 
 from vistautils.parameters_only_entrypoint import parameters_only_entry_point
-import adam.experiment.log_experiment as log_experiment_script
 
 
 def object_language_ablation_runner_entry_point(params: Parameters) -> None:
     """This function creates all possible object language ablation param files within a given range"""
+    # log_experiment pulls in the whole learner and curriculum stack,
+    # so we only import it when we are actually going to schedule experiments
+    import adam.experiment.log_experiment as log_experiment_script
+
     initialize_vista_pegasus_wrapper(params)
 
     baseline_parameters = params.namespace("object_language_ablation")
@@ -35,156 +39,213 @@ def object_language_ablation_runner_entry_point(params: Parameters) -> None:
     num_language_accuracy_increment = params.integer(
         "num_language_accuracy_increment", default=5
     )
-    values_for_accuracy = np.linspace(
-        min_language_accuracy, max_language_accuracy, num_language_accuracy_increment
+    # evenly spaced values between the minimum and maximum accuracy, inclusive
+    accuracy_step = (max_language_accuracy - min_language_accuracy) / max(
+        num_language_accuracy_increment - 1, 1
     )
+    values_for_accuracy = [
+        min_language_accuracy + i * accuracy_step
+        for i in range(num_language_accuracy_increment)
+    ]
 
     limit_jobs_for_category(
         "pursuit", params.integer("num_pursuit_learners_active", default=8)
     )
 
-    for num_objects in range(min_num_objects, max_num_objects + 1):
-        for language_accuracy in values_for_accuracy:
-            for learner_type in LEARNER_VALUES_TO_PARAMS:
-                for params_str, learner_params in LEARNER_VALUES_TO_PARAMS[learner_type]:
-                    experiment_name_string = EXPERIMENT_NAME_FORMAT.format(
-                        num_objects=num_objects,
-                        language_accuracy=language_accuracy,
-                        learner_type=learner_type,
-                        learner_params=params_str,
-                    )
-                    experiment_name = Locator(experiment_name_string.split("-"))
-
-                    # Note that the input parameters should include the root params and
-                    # anything else we want.
-                    experiment_params = baseline_parameters.unify(FIXED_PARAMETERS).unify(
-                        {
-                            "experiment": experiment_name_string,
-                            "experiment_group_dir": directory_for(experiment_name),
-                            "hypothesis_log_dir": directory_for(experiment_name)
-                            / "hypotheses",
-                            "learner_logging_path": directory_for(experiment_name),
-                            "log_learner_state": True,
-                            "resume_from_latest_logged_state": True,
-                            "train_curriculum": {
-                                "accurate_language_percentage": float(language_accuracy)
-                            },
-                            "object_learner_type": learner_type,
-                            "object_learner": learner_params,
-                            # We subtract one because the target object is a given
-                            "num_noise_objects": num_objects - 1,
-                        }
-                    )
-
-                    run_python_on_parameters(
-                        experiment_name,
-                        log_experiment_script,
-                        experiment_params,
-                        depends_on=[],
-                        resource_request=SlurmResourceRequest.from_parameters(
-                            pursuit_resource_request_params
-                        )
-                        if learner_type == "pursuit"
-                        else None,
-                        category=learner_type,
-                    )
+    # the fixed parameters are the same for every experiment in the sweep,
+    # so we only need to merge them with the baseline once
+    baseline_with_fixed_parameters = baseline_parameters.unify(FIXED_PARAMETERS)
+    learner_configurations = [
+        (learner_type, params_str, learner_params)
+        for learner_type, learner_values in LEARNER_VALUES_TO_PARAMS.items()
+        for params_str, learner_params in learner_values
+    ]
+
+    for (
+        num_objects,
+        language_accuracy,
+        (learner_type, params_str, learner_params),
+    ) in product(
+        range(min_num_objects, max_num_objects + 1),
+        values_for_accuracy,
+        learner_configurations,
+    ):
+        experiment_name_parts = _experiment_name_parts(
+            num_objects=num_objects,
+            language_accuracy=language_accuracy,
+            learner_type=learner_type,
+            learner_params=params_str,
+        )
+        experiment_name_string = "-".join(experiment_name_parts)
+        experiment_name = Locator(experiment_name_parts)
+        experiment_directory = directory_for(experiment_name)
+
+        # Note that the input parameters should include the root params and
+        # anything else we want.
+        experiment_params = baseline_with_fixed_parameters.unify(
+            {
+                "experiment": experiment_name_string,
+                "experiment_group_dir": experiment_directory,
+                "hypothesis_log_dir": experiment_directory / "hypotheses",
+                "learner_logging_path": experiment_directory,
+                "log_learner_state": True,
+                "resume_from_latest_logged_state": True,
+                "train_curriculum": {"accurate_language_percentage": language_accuracy},
+                "object_learner_type": learner_type,
+                "object_learner": learner_params,
+                # We subtract one because the target object is a given
+                "num_noise_objects": num_objects - 1,
+            }
+        )
+
+        run_python_on_parameters(
+            experiment_name,
+            log_experiment_script,
+            experiment_params,
+            depends_on=[],
+            resource_request=SlurmResourceRequest.from_parameters(
+                pursuit_resource_request_params
+            )
+            if learner_type == "pursuit"
+            else None,
+            category=learner_type,
+        )
 
     write_workflow_description()
 
 
-EXPERIMENT_NAME_FORMAT = "{num_objects:d}_objects-{language_accuracy:.2f}_language_accuracy-{learner_type}_object_learner-{learner_params}_params"
+def _experiment_name_parts(
+    *, num_objects: int, language_accuracy: float, learner_type: str, learner_params: str
+) -> Tuple[str, ...]:
+    """
+    Gets the components of an experiment's name.
+
+    These are used directly as the experiment's `Locator`
+    and joined with "-" to get the experiment name string.
+    """
+    return (
+        f"{num_objects:d}_objects",
+        f"{language_accuracy:.2f}_language_accuracy",
+        f"{learner_type}_object_learner",
+        f"{learner_params}_params",
+    )
+
 
 # ["subset", "pbv", "cross_situational", "pursuit"]
-LEARNER_VALUES_TO_PARAMS: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {
-    "subset": [("subset", {"learner_type": "subset", "ontology": "phase2"})],
-    "pbv": [
-        (
-            "0.9_graph_match_conf",
-            {
-                "learner_type": "pbv",
-                "random_seed": 0,
-                "graph_match_confirmation_threshold": 0.9,
-            },
-        ),
-        (
-            "0.95_graph_match_conf",
-            {
-                "learner_type": "pbv",
-                "random_seed": 0,
-                "graph_match_confirmation_threshold": 0.95,
-            },
-        ),
-        (
-            "1.0_graph_match_conf",
-            {
-                "learner_type": "pbv",
-                "random_seed": 0,
-                "graph_match_confirmation_threshold": 1.0,
-            },
-        ),
-    ],
-    "cross_situational": [
-        (
-            "0.9_graph_match_conf",
-            {
-                "learner_type": "cross-situational",
-                "lexicon_entry_threshold": 0.7,
-                "smoothing_parameter": 0.001,
-                "graph_match_confirmation_threshold": 0.9,
-            },
-        ),
-        (
-            "0.95_graph_match_conf",
-            {
-                "learner_type": "cross-situational",
-                "lexicon_entry_threshold": 0.7,
-                "smoothing_parameter": 0.001,
-                "graph_match_confirmation_threshold": 0.95,
-            },
-        ),
-        (
-            "1.0_graph_match_conf",
-            {
-                "learner_type": "cross-situational",
-                "lexicon_entry_threshold": 0.7,
-                "smoothing_parameter": 0.001,
-                "graph_match_confirmation_threshold": 1.0,
-            },
+LEARNER_VALUES_TO_PARAMS: Mapping[
+    str, Sequence[Tuple[str, Mapping[str, Any]]]
+] = immutabledict(
+    {
+        "subset": (
+            ("subset", immutabledict({"learner_type": "subset", "ontology": "phase2"})),
         ),
-    ],
-    "pursuit": [
-        (
-            "0.9_graph_match_conf",
-            {
-                "learner_type": "pursuit",
-                "learning_factor": 0.02,
-                "graph_match_confirmation_threshold": 0.9,
-                "lexicon_entry_threshold": 0.7,
-                "smoothing_parameter": 0.001,
-            },
+        "pbv": (
+            (
+                "0.9_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "pbv",
+                        "random_seed": 0,
+                        "graph_match_confirmation_threshold": 0.9,
+                    }
+                ),
+            ),
+            (
+                "0.95_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "pbv",
+                        "random_seed": 0,
+                        "graph_match_confirmation_threshold": 0.95,
+                    }
+                ),
+            ),
+            (
+                "1.0_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "pbv",
+                        "random_seed": 0,
+                        "graph_match_confirmation_threshold": 1.0,
+                    }
+                ),
+            ),
         ),
-        (
-            "0.95_graph_match_conf",
-            {
-                "learner_type": "pursuit",
-                "learning_factor": 0.02,
-                "graph_match_confirmation_threshold": 0.95,
-                "lexicon_entry_threshold": 0.7,
-                "smoothing_parameter": 0.001,
-            },
+        "cross_situational": (
+            (
+                "0.9_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "cross-situational",
+                        "lexicon_entry_threshold": 0.7,
+                        "smoothing_parameter": 0.001,
+                        "graph_match_confirmation_threshold": 0.9,
+                    }
+                ),
+            ),
+            (
+                "0.95_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "cross-situational",
+                        "lexicon_entry_threshold": 0.7,
+                        "smoothing_parameter": 0.001,
+                        "graph_match_confirmation_threshold": 0.95,
+                    }
+                ),
+            ),
+            (
+                "1.0_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "cross-situational",
+                        "lexicon_entry_threshold": 0.7,
+                        "smoothing_parameter": 0.001,
+                        "graph_match_confirmation_threshold": 1.0,
+                    }
+                ),
+            ),
         ),
-        (
-            "1.0_graph_match_conf",
-            {
-                "learner_type": "pursuit",
-                "learning_factor": 0.02,
-                "graph_match_confirmation_threshold": 1.0,
-                "lexicon_entry_threshold": 0.7,
-                "smoothing_parameter": 0.001,
-            },
+        "pursuit": (
+            (
+                "0.9_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "pursuit",
+                        "learning_factor": 0.02,
+                        "graph_match_confirmation_threshold": 0.9,
+                        "lexicon_entry_threshold": 0.7,
+                        "smoothing_parameter": 0.001,
+                    }
+                ),
+            ),
+            (
+                "0.95_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "pursuit",
+                        "learning_factor": 0.02,
+                        "graph_match_confirmation_threshold": 0.95,
+                        "lexicon_entry_threshold": 0.7,
+                        "smoothing_parameter": 0.001,
+                    }
+                ),
+            ),
+            (
+                "1.0_graph_match_conf",
+                immutabledict(
+                    {
+                        "learner_type": "pursuit",
+                        "learning_factor": 0.02,
+                        "graph_match_confirmation_threshold": 1.0,
+                        "lexicon_entry_threshold": 0.7,
+                        "smoothing_parameter": 0.001,
+                    }
+                ),
+            ),
         ),
-    ],
-}
+    }
+)
 
 FIXED_PARAMETERS = {
     "curriculum": "m15-object-noise-experiments",
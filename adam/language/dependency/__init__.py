@@ -2,6 +2,7 @@
 Representations for dependency trees
 """
 from abc import ABC, abstractmethod
+from functools import partial
 from typing import Iterable, Tuple
 
 from attr import attrib, attrs
@@ -116,7 +117,7 @@ class LinearizedDependencyTree(LinguisticDescription):
     """
 
     def as_token_sequence(self) -> Tuple[str, ...]:
-        return tuple(node.token for node in self.surface_token_order)
+        return self.surface_token_strings
 
     def __attrs_post_init__(self) -> None:
         surface_tokens = immutableset(self.surface_token_order)
@@ -142,7 +143,7 @@ class LinearizedDependencyTree(LinguisticDescription):
         return tuple(node.token for node in self.surface_token_order)
 
 
-@attrs(frozen=True, slots=True, repr=False)
+@attrs(frozen=True, slots=True, repr=False, cache_hash=True)
 class PartOfSpeechTag:
     """
     Part-of-speech tags.
@@ -194,7 +195,7 @@ class DependencyTreeToken:
         return f"{self.token}/{self.part_of_speech}{msp_string}"
 
 
-@attrs(frozen=True, slots=True, repr=False)
+@attrs(frozen=True, slots=True, repr=False, cache_hash=True)
 class DependencyRole:
     """
     The syntactic relationship between two nodes in a `DependencyTree`.
@@ -248,6 +249,10 @@ class RoleOrderDependencyTreeLinearizer(DependencyTreeLinearizer):
     _head_pos_to_role_order: ImmutableDict[
         PartOfSpeechTag, Tuple[DependencyRole, ...]
     ] = attrib(converter=_to_immutabledict, default=immutabledict())
+    # derived from _head_pos_to_role_order, so it is left out of equality and repr
+    _head_pos_to_role_to_position: ImmutableDict[
+        PartOfSpeechTag, ImmutableDict[DependencyRole, int]
+    ] = attrib(init=False, eq=False, repr=False)
 
     def linearize(self, dependency_tree: DependencyTree) -> LinearizedDependencyTree:
         # TODO: handle tokens which correspond to dependency tree edges
@@ -273,21 +278,15 @@ class RoleOrderDependencyTreeLinearizer(DependencyTreeLinearizer):
             # the head has no modifiers, so there is nothing to order
             return (head_node,)
 
-        role_order = self._head_pos_to_role_order[head_node.part_of_speech]
-
-        def position(node: Tuple[DependencyTreeToken, DependencyRole]) -> int:
-            role = node[1]
-            try:
-                return role_order.index(role)
-            except ValueError:
-                raise RuntimeError(
-                    f"Do not know how to order modifiers with role "
-                    f"{role} relative to head of POS tag "
-                    f"{head_node.part_of_speech}. We know how to handle the "
-                    f"following roles: {role_order}"
-                )
-
-        nodes_in_order = sorted(nodes_to_order, key=position)
+        head_pos_tag = head_node.part_of_speech
+        nodes_in_order = sorted(
+            nodes_to_order,
+            key=partial(
+                _role_position,
+                head_pos_tag,
+                self._head_pos_to_role_to_position[head_pos_tag],
+            ),
+        )
 
         return flatten(
             self._linearize(dependency_tree, node)
@@ -306,3 +305,34 @@ class RoleOrderDependencyTreeLinearizer(DependencyTreeLinearizer):
                     f"mark the head position using the HEAD constant from "
                     f"this module."
                 )
+
+    @_head_pos_to_role_to_position.default
+    def _init_head_pos_to_role_to_position(
+        self
+    ) -> ImmutableDict[PartOfSpeechTag, ImmutableDict[DependencyRole, int]]:
+        # the role positions are computed once here rather than on every call to _linearize
+        return immutabledict(
+            (pos_tag, immutabledict((role, i) for (i, role) in enumerate(role_order)))
+            for (pos_tag, role_order) in self._head_pos_to_role_order.items()
+        )
+
+
+def _role_position(
+    head_pos_tag: PartOfSpeechTag,
+    role_to_position: ImmutableDict[DependencyRole, int],
+    node: Tuple[DependencyTreeToken, DependencyRole],
+) -> int:
+    """
+    Sort key placing a (node, role) pair according to the position of its role
+    among the modifiers of a head with part-of-speech *head_pos_tag*.
+    """
+    role = node[1]
+    try:
+        return role_to_position[role]
+    except KeyError:
+        raise RuntimeError(
+            f"Do not know how to order modifiers with role "
+            f"{role} relative to head of POS tag "
+            f"{head_pos_tag}. We know how to handle the "
+            f"following roles: {tuple(role_to_position)}"
+        )
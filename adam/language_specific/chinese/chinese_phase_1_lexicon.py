@@ -9,6 +9,12 @@ morphologically-realized feature in Chinese.
 
 This vocabulary has been verified by a native speaker.
 """
+from immutablecollections import (
+    ImmutableListMultiDict,
+    immutablelistmultidict,
+    immutableset,
+)
+
 from adam.language_specific import (
     FIRST_PERSON,
     SECOND_PERSON,
@@ -95,6 +101,9 @@ GRAB = LexiconEntry("chyang3 na2 chi3", VERB)
 SHOVE = LexiconEntry("yung4 li4 twei1", VERB)
 # throw and toss are the same in Chinese
 TOSS = LexiconEntry("reng1", VERB)
+# shared by all mass noun entries;
+# LexiconEntry keeps an ImmutableSet as-is rather than copying it
+_MASS_NOUN_PROPERTIES = immutableset([MASS_NOUN])
 GAILA_PHASE_1_CHINESE_LEXICON = OntologyLexicon(
     ontology=GAILA_PHASE_1_ONTOLOGY,
     ontology_node_to_word=(
@@ -112,13 +121,28 @@ GAILA_PHASE_1_CHINESE_LEXICON = OntologyLexicon(
         (BOOK, LexiconEntry("shu1", NOUN, counting_classifier="ben3")),
         (HOUSE, LexiconEntry("wu1", NOUN, counting_classifier="jyan1")),
         (CAR, LexiconEntry("chi4 che1", NOUN, counting_classifier="lyang4")),
-        (WATER, LexiconEntry("shwei3", NOUN, [MASS_NOUN], counting_classifier="bei1")),
-        (JUICE, LexiconEntry("gwo3 jr1", NOUN, [MASS_NOUN], counting_classifier="bei1")),
+        (
+            WATER,
+            LexiconEntry(
+                "shwei3", NOUN, _MASS_NOUN_PROPERTIES, counting_classifier="bei1"
+            ),
+        ),
+        (
+            JUICE,
+            LexiconEntry(
+                "gwo3 jr1", NOUN, _MASS_NOUN_PROPERTIES, counting_classifier="bei1"
+            ),
+        ),
         (CUP, LexiconEntry("bei1 dz", NOUN)),
         (BOX, LexiconEntry("syang1 dz", NOUN)),
         (CHAIR, LexiconEntry("yi3 dz", NOUN, counting_classifier="ba3")),
         (HEAD, LexiconEntry("tou2", NOUN)),
-        (MILK, LexiconEntry("nyou2 nai3", NOUN, [MASS_NOUN], counting_classifier="bei1")),
+        (
+            MILK,
+            LexiconEntry(
+                "nyou2 nai3", NOUN, _MASS_NOUN_PROPERTIES, counting_classifier="bei1"
+            ),
+        ),
         (HAND, LexiconEntry("shou3", NOUN, counting_classifier="jr1")),
         (TRUCK, LexiconEntry("ka3 che1", NOUN, counting_classifier="lyang4")),
         (DOOR, LexiconEntry("men2", NOUN, counting_classifier="shan4")),
@@ -162,3 +186,16 @@ GAILA_PHASE_1_CHINESE_LEXICON = OntologyLexicon(
         (WALK, LexiconEntry("bu4 sying2", VERB)),
     ),
 )
+
+GAILA_PHASE_1_CHINESE_HANDLE_TO_BASE_FORMS: ImmutableListMultiDict[
+    str, str
+] = immutablelistmultidict(
+    (node.handle, entry.base_form)
+    for node, entry in GAILA_PHASE_1_CHINESE_LEXICON._ontology_node_to_word.items()  # pylint:disable=protected-access
+)
+"""
+Maps ontology node handles to the base forms of their Chinese lexicon entries.
+
+This is precomputed so learners can look up the Chinese lexicalization of a recognized
+object concept by its debug string without scanning the whole lexicon.
+"""
@@ -182,23 +182,25 @@ def get_largest_matching_pattern(
 def graph_without_learner(perception_graph: PerceptionGraph) -> PerceptionGraph:
     """ Helper function to return a `PerceptionGraph`
     without a ground object and its related nodes."""
-    graph = perception_graph.copy_as_digraph()
     # Get the learner node
     learner_node_candidates = [
         node
-        for node in graph.nodes()
+        for node in perception_graph._graph  # pylint:disable=protected-access
         if isinstance(node, ObjectPerception) and node.debug_handle == LEARNER.handle
     ]
     if len(learner_node_candidates) > 1:
         raise RuntimeError("More than one learners in perception.")
     elif len(learner_node_candidates) == 1:
+        # We only need to copy the graph if there is a learner to remove.
+        graph = perception_graph.copy_as_digraph()
         learner_node = first(learner_node_candidates)
         # Remove learner
         graph.remove_node(learner_node)
         # remove remaining islands
         islands = list(isolates(graph))
         graph.remove_nodes_from(islands)
-    return PerceptionGraph(graph, dynamic=perception_graph.dynamic)
+        return PerceptionGraph(graph, dynamic=perception_graph.dynamic)
+    return perception_graph
 
 
 class ComposableLearner(ABC):
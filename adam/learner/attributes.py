@@ -345,6 +345,7 @@ class PursuitAttributeLearnerNew(
         graph: PerceptionGraph,
         *,
         required_alignments: Mapping[SyntaxSemanticsVariable, ObjectSemanticNode],
+        min_match_ratio: Optional[float] = None,
     ) -> "AbstractPursuitLearnerNew.PartialMatch":
         pattern = hypothesis.graph_pattern
         hypothesis_pattern_common_subgraph = get_largest_matching_pattern(
@@ -353,6 +354,7 @@ class PursuitAttributeLearnerNew(
             debug_callback=self._debug_callback,
             graph_logger=self._hypothesis_logger,
             ontology=self._ontology,
+            match_ratio=min_match_ratio,
             match_mode=MatchMode.NON_OBJECT,
             allowed_matches=immutablesetmultidict(
                 [
@@ -365,7 +367,7 @@ class PursuitAttributeLearnerNew(
 
         leading_hypothesis_num_nodes = len(pattern)
         num_nodes_matched = (
-            len(hypothesis_pattern_common_subgraph.copy_as_digraph().nodes)
+            len(hypothesis_pattern_common_subgraph)
             if hypothesis_pattern_common_subgraph
             else 0
         )
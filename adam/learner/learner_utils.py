@@ -38,6 +38,7 @@ from adam.learner.surface_templates import (
     SurfaceTemplateBoundToSemanticNodes,
 )
 from adam.ontology.ontology import Ontology
+from adam.ontology.phase1_ontology import PART_OF
 from adam.ontology.phase1_spatial_relations import Region
 from adam.perception import PerceptualRepresentation, MatchMode, ObjectPerception
 from adam.perception.developmental_primitive_perception import (
@@ -673,7 +674,7 @@ def compute_match_ratio(
     return PartialMatchRatio(
         hypothesis_pattern_common_subgraph,
         num_nodes_matched=(
-            len(hypothesis_pattern_common_subgraph.copy_as_digraph().nodes)
+            len(hypothesis_pattern_common_subgraph)
             if hypothesis_pattern_common_subgraph
             else 0
         ),
@@ -692,17 +693,23 @@ def get_objects_from_perception(
 
     meanings = []
 
+    # We collect the partOf edges in a single pass
+    # rather than scanning every edge for every node.
+    part_of_edges = immutableset(
+        (source, target)
+        for (source, target, label) in perception_as_digraph.edges(data="label")
+        if label == PART_OF
+    )
+    parts = immutableset(source for (source, _) in part_of_edges)
+
     # 1) Take all of the obj perc that dont have part of relationships with anything else
-    root_object_percetion_nodes = []
-    for node in perception_as_graph.nodes:
-        if isinstance(node, ObjectPerception) and node.debug_handle != "the ground":
-            if not any(
-                [
-                    u == node and str(data["label"]) == "partOf"
-                    for u, v, data in perception_as_digraph.edges.data()
-                ]
-            ):
-                root_object_percetion_nodes.append(node)
+    root_object_percetion_nodes = [
+        node
+        for node in perception_as_graph.nodes
+        if isinstance(node, ObjectPerception)
+        and node.debug_handle != "the ground"
+        and node not in parts
+    ]
 
     # 2) for each of these, walk along the part of relationships backwards,
     # i.e find all of the subparts of the root object
@@ -717,10 +724,7 @@ def get_objects_from_perception(
             new_frontier = []
             for frontier_node in frontier:
                 for node in perception_as_graph.neighbors(frontier_node):
-                    edge_data = perception_as_digraph.get_edge_data(
-                        node, frontier_node, default=-1
-                    )
-                    if edge_data != -1 and str(edge_data["label"]) == "partOf":
+                    if (node, frontier_node) in part_of_edges:
                         new_frontier.append(node)
 
             if new_frontier:
@@ -13,7 +13,7 @@ from typing import (
 )
 
 from adam.language_specific.chinese.chinese_phase_1_lexicon import (
-    GAILA_PHASE_1_CHINESE_LEXICON,
+    GAILA_PHASE_1_CHINESE_HANDLE_TO_BASE_FORMS,
 )
 from adam.learner.language_mode import LanguageMode
 from contexttimer import Timer
@@ -359,15 +359,11 @@ class ObjectRecognizer:
                             object_nodes.append((("wo3",), matched_object_node))
                         elif concept.debug_string == "you":
                             object_nodes.append((("ni3",), matched_object_node))
-                        mappings = (
-                            GAILA_PHASE_1_CHINESE_LEXICON._ontology_node_to_word  # pylint:disable=protected-access
-                        )
-                        for k, v in mappings.items():
-                            if k.handle == concept.debug_string:
-                                debug_string = str(v.base_form)
-                                object_nodes.append(
-                                    ((debug_string,), matched_object_node)
-                                )
+                        base_forms = GAILA_PHASE_1_CHINESE_HANDLE_TO_BASE_FORMS[
+                            concept.debug_string
+                        ]
+                        for base_form in base_forms:
+                            object_nodes.append(((base_form,), matched_object_node))
                     graph_to_return = replace_match_with_object_graph_node(
                         matched_object_node, graph_to_return, pattern_match
                     ).perception_graph_after_replacement
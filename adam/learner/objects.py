@@ -31,7 +31,7 @@ from typing import (
 from more_itertools import first
 
 from adam.language_specific.chinese.chinese_phase_1_lexicon import (
-    GAILA_PHASE_1_CHINESE_LEXICON,
+    GAILA_PHASE_1_CHINESE_HANDLE_TO_BASE_FORMS,
 )
 from adam.language_specific.english import DETERMINERS
 from adam.learner import (
@@ -79,12 +79,10 @@ from adam.learner.template_learner import (
 )
 from adam.ontology.ontology import Ontology
 from adam.ontology.phase1_ontology import GAILA_PHASE_1_ONTOLOGY
-from adam.ontology.phase1_spatial_relations import Region
 from adam.perception import ObjectPerception, PerceptualRepresentation, MatchMode
 from adam.perception.deprecated import LanguageAlignedPerception
 from adam.perception.developmental_primitive_perception import (
     DevelopmentalPrimitivePerceptionFrame,
-    RgbColorPerception,
 )
 from adam.perception.perception_graph import (
     PerceptionGraph,
@@ -102,7 +100,6 @@ from adam.semantics import (
     FunctionalObjectConcept,
     SyntaxSemanticsVariable,
 )
-from adam.utils import networkx_utils
 from adam.utils.networkx_utils import subgraph
 
 
@@ -274,73 +271,7 @@ class ObjectPursuitLearner(AbstractPursuitLearner, AbstractObjectTemplateLearner
     def get_objects_from_perception(
         self, observed_perception_graph: PerceptionGraph
     ) -> List[PerceptionGraph]:
-        perception_as_digraph = observed_perception_graph.copy_as_digraph()
-        perception_as_graph = perception_as_digraph.to_undirected()
-
-        meanings = []
-
-        # 1) Take all of the obj perc that dont have part of relationships with anything else
-        root_object_percetion_nodes = []
-        for node in perception_as_graph.nodes:
-            if isinstance(node, ObjectPerception) and node.debug_handle != "the ground":
-                if not any(
-                    [
-                        u == node and str(data["label"]) == "partOf"
-                        for u, v, data in perception_as_digraph.edges.data()
-                    ]
-                ):
-                    root_object_percetion_nodes.append(node)
-
-        # 2) for each of these, walk along the part of relationships backwards,
-        # i.e find all of the subparts of the root object
-        for root_object_perception_node in root_object_percetion_nodes:
-            # Iteratively get all other object perceptions that connect to a root with a part of
-            # relation
-            all_object_perception_nodes = [root_object_perception_node]
-            frontier = [root_object_perception_node]
-            updated = True
-            while updated:
-                updated = False
-                new_frontier = []
-                for frontier_node in frontier:
-                    for node in perception_as_graph.neighbors(frontier_node):
-                        edge_data = perception_as_digraph.get_edge_data(
-                            node, frontier_node, default=-1
-                        )
-                        if edge_data != -1 and str(edge_data["label"]) == "partOf":
-                            new_frontier.append(node)
-
-                if new_frontier:
-                    all_object_perception_nodes.extend(new_frontier)
-                    updated = True
-                    frontier = new_frontier
-
-            # Now we have a list of all perceptions that are connected
-            # 3) For each of these objects including root object, get axes, properties,
-            # and relations and regions which are between these internal object perceptions
-            other_nodes = []
-            for node in all_object_perception_nodes:
-                for neighbor in perception_as_graph.neighbors(node):
-                    # Filter out regions that don't have a reference in all object perception nodes
-                    # TODO: We currently remove colors to achieve a match - otherwise finding
-                    #  patterns fails.
-                    if (
-                        isinstance(neighbor, Region)
-                        and neighbor.reference_object not in all_object_perception_nodes
-                        or isinstance(neighbor, RgbColorPerception)
-                    ):
-                        continue
-                    # Append all other none-object nodes to be kept in the subgraph
-                    if not isinstance(neighbor, ObjectPerception):
-                        other_nodes.append(neighbor)
-
-            generated_subgraph = networkx_utils.subgraph(
-                perception_as_digraph, all_object_perception_nodes + other_nodes
-            )
-            meanings.append(PerceptionGraph(generated_subgraph))
-
-        logging.info(f"Got {len(meanings)} candidate meanings")
-        return meanings
+        return get_objects_from_perception(observed_perception_graph)
 
     def _hypothesis_from_perception(
         self, perception: PerceptionGraph
@@ -384,7 +315,11 @@ class ObjectPursuitLearner(AbstractPursuitLearner, AbstractObjectTemplateLearner
             return self.num_nodes_matched / self.num_nodes_in_pattern
 
     def _find_partial_match(
-        self, hypothesis: PerceptionGraphTemplate, graph: PerceptionGraph
+        self,
+        hypothesis: PerceptionGraphTemplate,
+        graph: PerceptionGraph,
+        *,
+        min_match_ratio: Optional[float] = None,
     ) -> "ObjectPursuitLearner.ObjectHypothesisPartialMatch":
         pattern = hypothesis.graph_pattern
         hypothesis_pattern_common_subgraph = get_largest_matching_pattern(
@@ -393,13 +328,14 @@ class ObjectPursuitLearner(AbstractPursuitLearner, AbstractObjectTemplateLearner
             debug_callback=self._debug_callback,
             graph_logger=self._hypothesis_logger,
             ontology=self._ontology,
+            match_ratio=min_match_ratio,
             match_mode=MatchMode.OBJECT,
         )
         self.debug_counter += 1
 
         leading_hypothesis_num_nodes = len(pattern)
         num_nodes_matched = (
-            len(hypothesis_pattern_common_subgraph.copy_as_digraph().nodes)
+            len(hypothesis_pattern_common_subgraph)
             if hypothesis_pattern_common_subgraph
             else 0
         )
@@ -818,18 +754,15 @@ class ObjectRecognizerAsTemplateLearner(TemplateLearner):
                         )
                     ]
                 )
-            mappings = (
-                GAILA_PHASE_1_CHINESE_LEXICON._ontology_node_to_word  # pylint:disable=protected-access
-            )
-            for k, v in mappings.items():
-                if k.handle == concept.debug_string:
-                    return immutableset(
-                        [
-                            SurfaceTemplate.for_object_name(
-                                v.base_form, language_mode=self._language_mode
-                            )
-                        ]
-                    )
+            base_forms = GAILA_PHASE_1_CHINESE_HANDLE_TO_BASE_FORMS[concept.debug_string]
+            if base_forms:
+                return immutableset(
+                    [
+                        SurfaceTemplate.for_object_name(
+                            base_forms[0], language_mode=self._language_mode
+                        )
+                    ]
+                )
         # FunctionalObjectConcepts mean we have recognized an object but don't have
         # Knowledge of what the lexicalization is. So we just return an empty set
         if isinstance(concept, FunctionalObjectConcept):
@@ -880,9 +813,23 @@ class PursuitObjectLearnerNew(
     An implementation of pursuit learner for object recognition
     """
 
+    # The candidate objects of an observation don't depend on the surface template,
+    # so we keep those for the observation currently being learned from
+    # rather than re-extracting them for every template learned from it.
+    # This is cleared once the observation has been processed.
+    _perception_graph_to_hypotheses: Optional[
+        Tuple[PerceptionGraph, ImmutableSet[PerceptionGraphTemplate]]
+    ] = attrib(init=False, default=None, eq=False, repr=False)
+
     def _new_concept(self, debug_string: str) -> ObjectConcept:
         return ObjectConcept(debug_string)
 
+    def _post_learning_step(
+        self, language_perception_semantic_alignment: LanguagePerceptionSemanticAlignment
+    ) -> None:
+        super()._post_learning_step(language_perception_semantic_alignment)
+        self._perception_graph_to_hypotheses = None
+
     def _hypotheses_from_perception(
         self,
         learning_state: LanguagePerceptionSemanticAlignment,
@@ -893,18 +840,26 @@ class PursuitObjectLearnerNew(
                 "Object learner should not have slot to semantic node alignments!"
             )
 
-        return immutableset(
-            PerceptionGraphTemplate(
-                graph_pattern=PerceptionGraphPattern.from_graph(
-                    candidate_object
-                ).perception_graph_pattern,
-                template_variable_to_pattern_node=immutabledict(),
-            )
-            for candidate_object in extract_candidate_objects(
-                learning_state.perception_semantic_alignment.perception_graph,
-                sort_by_increasing_size=False,
+        perception_graph = learning_state.perception_semantic_alignment.perception_graph
+        if (
+            self._perception_graph_to_hypotheses is None
+            or self._perception_graph_to_hypotheses[0] is not perception_graph
+        ):
+            self._perception_graph_to_hypotheses = (
+                perception_graph,
+                immutableset(
+                    PerceptionGraphTemplate(
+                        graph_pattern=PerceptionGraphPattern.from_graph(
+                            candidate_object
+                        ).perception_graph_pattern,
+                        template_variable_to_pattern_node=immutabledict(),
+                    )
+                    for candidate_object in extract_candidate_objects(
+                        perception_graph, sort_by_increasing_size=False
+                    )
+                ),
             )
-        )
+        return self._perception_graph_to_hypotheses[1]
 
     # I can't spot the difference in arguments pylint claims?
     def _keep_hypothesis(  # pylint: disable=arguments-differ
@@ -943,6 +898,7 @@ class PursuitObjectLearnerNew(
         required_alignments: Mapping[
             SyntaxSemanticsVariable, ObjectSemanticNode
         ],  # pylint:disable=unused-argument
+        min_match_ratio: Optional[float] = None,
     ) -> "PursuitObjectLearnerNew.ObjectHypothesisPartialMatch":
         pattern = hypothesis.graph_pattern
         hypothesis_pattern_common_subgraph = get_largest_matching_pattern(
@@ -951,13 +907,14 @@ class PursuitObjectLearnerNew(
             debug_callback=self._debug_callback,
             graph_logger=self._hypothesis_logger,
             ontology=self._ontology,
+            match_ratio=min_match_ratio,
             match_mode=MatchMode.OBJECT,
         )
         self.debug_counter += 1
 
         leading_hypothesis_num_nodes = len(pattern)
         num_nodes_matched = (
-            len(hypothesis_pattern_common_subgraph.copy_as_digraph().nodes)
+            len(hypothesis_pattern_common_subgraph)
             if hypothesis_pattern_common_subgraph
             else 0
         )
@@ -211,7 +211,11 @@ class PrepositionPursuitLearner(
             return self.num_nodes_matched / self.num_nodes_in_pattern
 
     def _find_partial_match(
-        self, hypothesis: PerceptionGraphTemplate, graph: PerceptionGraph
+        self,
+        hypothesis: PerceptionGraphTemplate,
+        graph: PerceptionGraph,
+        *,
+        min_match_ratio: Optional[float] = None,
     ) -> "PrepositionPursuitLearner.PrepositionHypothesisPartialMatch":
         pattern = hypothesis.graph_pattern
         hypothesis_pattern_common_subgraph = get_largest_matching_pattern(
@@ -220,13 +224,14 @@ class PrepositionPursuitLearner(
             debug_callback=self._debug_callback,
             graph_logger=self._hypothesis_logger,
             ontology=self._ontology,
+            match_ratio=min_match_ratio,
             match_mode=MatchMode.OBJECT,
         )
         self.debug_counter += 1
 
         leading_hypothesis_num_nodes = len(pattern)
         num_nodes_matched = (
-            len(hypothesis_pattern_common_subgraph.copy_as_digraph().nodes)
+            len(hypothesis_pattern_common_subgraph)
             if hypothesis_pattern_common_subgraph
             else 0
         )
@@ -2,6 +2,7 @@ import logging
 import copy
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from heapq import nsmallest
 from pathlib import Path
 from random import Random
 
@@ -122,6 +123,11 @@ class AbstractPursuitLearner(AbstractTemplateLearner, ABC):
     _graph_match_confirmation_threshold: float = attrib(default=0.9, kw_only=True)
     # Threshold value for adding word to lexicon
     _lexicon_entry_threshold: float = attrib(default=0.8, kw_only=True)
+    # If set, only this many of the highest-scoring hypotheses are kept for each item,
+    # which bounds the matching work done on each learning step.
+    _max_hypotheses_per_item: Optional[int] = attrib(
+        validator=optional(in_(Range.at_least(1))), default=None, kw_only=True
+    )
     # Counter to be used to prevent prematurely lexicalizing novel words
     _learned_item_to_number_of_observations: Dict[SurfaceTemplate, int] = attrib(
         init=False, default=Factory(lambda: defaultdict(int))
@@ -207,19 +213,22 @@ class AbstractPursuitLearner(AbstractTemplateLearner, ABC):
 
         pattern_hypothesis = first(hypotheses)
         min_score = float("inf")
+        # Existing hypotheses from highest to lowest score,
+        # so the first one isomorphic to a candidate gives its maximum association score.
+        existing_hypotheses_and_scores = _by_decreasing_score(
+            self._learned_item_to_hypotheses_and_scores.values()
+        )
         # Of the possible meanings for the word in this scene,
         # make our initial hypothesis the one with the least association
         # with any other word.
         for hypothesis in hypotheses:
-            # TODO Try to make this more efficient?
-            max_association_score = max(
-                [
+            max_association_score = next(
+                (
                     s
-                    for w, h_to_s in self._learned_item_to_hypotheses_and_scores.items()
-                    for h, s in h_to_s.items()
+                    for h, s in existing_hypotheses_and_scores
                     if self._are_isomorphic(h, hypothesis)
-                ]
-                + [0]
+                ),
+                0,
             )
             if max_association_score < min_score:
                 pattern_hypothesis = hypothesis
@@ -266,8 +275,12 @@ class AbstractPursuitLearner(AbstractTemplateLearner, ABC):
 
         # If the leading hypothesis sufficiently matches the observation, reinforce it
         # To do, we check how much of the leading pattern hypothesis matches the perception
+        # Partial matches below the confirmation threshold are never used,
+        # so there is no need to relax the pattern past that point.
         partial_match = self._find_partial_match(
-            leading_hypothesis_pattern, language_aligned_perception.perception_graph
+            leading_hypothesis_pattern,
+            language_aligned_perception.perception_graph,
+            min_match_ratio=self._graph_match_confirmation_threshold,
         )
 
         # b.i) If the hypothesis is confirmed, we reinforce it.
@@ -341,7 +354,9 @@ class AbstractPursuitLearner(AbstractTemplateLearner, ABC):
 
                 for hypothesis in hypotheses_for_item:
                     non_leading_hypothesis_partial_match = self._find_partial_match(
-                        hypothesis, language_aligned_perception.perception_graph
+                        hypothesis,
+                        language_aligned_perception.perception_graph,
+                        min_match_ratio=self._graph_match_confirmation_threshold,
                     )
                     if (
                         non_leading_hypothesis_partial_match.match_score()
@@ -393,6 +408,11 @@ class AbstractPursuitLearner(AbstractTemplateLearner, ABC):
                         hypothesis_object_to_reward
                     )
 
+        if self._max_hypotheses_per_item is not None:
+            _drop_lowest_scoring_hypotheses(
+                hypotheses_for_item, keep=self._max_hypotheses_per_item
+            )
+
         return hypothesis_is_confirmed
 
     @attrs(frozen=True)
@@ -561,11 +581,18 @@ class AbstractPursuitLearner(AbstractTemplateLearner, ABC):
 
     @abstractmethod
     def _find_partial_match(
-        self, hypothesis: PerceptionGraphTemplate, graph: PerceptionGraph
+        self,
+        hypothesis: PerceptionGraphTemplate,
+        graph: PerceptionGraph,
+        *,
+        min_match_ratio: Optional[float] = None,
     ) -> "AbstractPursuitLearner.PartialMatch":
         """
         Compute the degree to which a meaning matches a perception.
         The resulting score should be between 0.0 (no match) and 1.0 (a perfect match)
+
+        If *min_match_ratio* is specified, implementations may stop searching
+        once no match that large is possible and report no match instead.
         """
 
     @abstractmethod
@@ -622,6 +649,11 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
     _graph_match_confirmation_threshold: float = attrib(default=0.9, kw_only=True)
     # Threshold value for adding word to lexicon
     _lexicon_entry_threshold: float = attrib(default=0.8, kw_only=True)
+    # If set, only this many of the highest-scoring hypotheses are kept for each item,
+    # which bounds the matching work done on each learning step.
+    _max_hypotheses_per_item: Optional[int] = attrib(
+        validator=optional(in_(Range.at_least(1))), default=None, kw_only=True
+    )
     # Counter to be used to prevent prematurely lexicalizing novel words
     _learned_item_to_number_of_observations: Dict[SurfaceTemplate, int] = attrib(
         init=False, default=Factory(lambda: defaultdict(int))
@@ -725,27 +757,31 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
 
         pattern_hypothesis = first(hypotheses)
         min_score = float("inf")
+        # Existing hypotheses from highest to lowest score,
+        # so the first one isomorphic to a candidate gives its maximum association score.
+        existing_hypotheses_and_scores = _by_decreasing_score(
+            self._concept_to_hypotheses_and_scores.values()
+        )
         # get all objects that have gaze
         gazed_at_hypotheses: List[PerceptionGraphTemplate] = []
         if self.rank_gaze_higher:
             for hypothesis in hypotheses:
                 if GAZED_AT in [
                     node.property_value
-                    for node in hypothesis.graph_pattern.copy_as_digraph().node
+                    for node in hypothesis.graph_pattern
                     if isinstance(node, IsOntologyNodePredicate)
                 ]:
                     gazed_at_hypotheses.append(hypothesis)
         # if there is only one object that has gaze, then this is the one that we consider -- we prioritize gaze above all else
         if len(gazed_at_hypotheses) == 1:
             pattern_hypothesis = first(gazed_at_hypotheses)
-            min_score = max(
-                [
+            min_score = next(
+                (
                     s
-                    for w, h_to_s in self._concept_to_hypotheses_and_scores.items()
-                    for h, s in h_to_s.items()
+                    for h, s in existing_hypotheses_and_scores
                     if h.graph_pattern.check_isomorphism(pattern_hypothesis.graph_pattern)
-                ]
-                + [0]
+                ),
+                0,
             )
         # otherwise, we make our initial hypothesis the one with the least association with any other word
         else:
@@ -761,15 +797,13 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
             # make our initial hypothesis the one with the least association
             # with any other word.
             for hypothesis in hypotheses_to_consider:
-                # TODO Try to make this more efficient?
-                max_association_score = max(
-                    [
+                max_association_score = next(
+                    (
                         s
-                        for w, h_to_s in self._concept_to_hypotheses_and_scores.items()
-                        for h, s in h_to_s.items()
+                        for h, s in existing_hypotheses_and_scores
                         if h.graph_pattern.check_isomorphism(hypothesis.graph_pattern)
-                    ]
-                    + [0]
+                    ),
+                    0,
                 )
                 if max_association_score < min_score:
                     pattern_hypothesis = hypothesis
@@ -833,10 +867,13 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
 
         # If the leading hypothesis sufficiently matches the observation, reinforce it
         # To do, we check how much of the leading pattern hypothesis matches the perception
+        # Partial matches below the confirmation threshold are never used,
+        # so there is no need to relax the pattern past that point.
         partial_match = self._find_partial_match(
             leading_hypothesis_pattern,
             language_perception_semantic_alignment.perception_semantic_alignment.perception_graph,
             required_alignments=bound_surface_template.slot_to_semantic_node,
+            min_match_ratio=self._graph_match_confirmation_threshold,
         )
 
         # b.i) If the hypothesis is confirmed, we reinforce it.
@@ -910,7 +947,7 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
                     for hypothesis in hypotheses:
                         if GAZED_AT in [
                             node.property_value
-                            for node in hypothesis.graph_pattern.copy_as_digraph().node
+                            for node in hypothesis.graph_pattern
                             if isinstance(node, IsOntologyNodePredicate)
                         ]:
                             gazed_at_possibilities.append(hypothesis)
@@ -933,6 +970,7 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
                         hypothesis,
                         language_perception_semantic_alignment.perception_semantic_alignment.perception_graph,
                         required_alignments=bound_surface_template.slot_to_semantic_node,
+                        min_match_ratio=self._graph_match_confirmation_threshold,
                     )
                     if (
                         non_leading_hypothesis_partial_match.match_score()
@@ -992,6 +1030,11 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
                         hypothesis_object_to_reward
                     )
 
+        if self._max_hypotheses_per_item is not None:
+            _drop_lowest_scoring_hypotheses(
+                hypotheses_for_item, keep=self._max_hypotheses_per_item
+            )
+
         return hypothesis_is_confirmed
 
     @attrs(frozen=True)
@@ -1161,10 +1204,14 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
         graph: PerceptionGraph,
         *,
         required_alignments: Mapping[SyntaxSemanticsVariable, ObjectSemanticNode],
+        min_match_ratio: Optional[float] = None,
     ) -> "AbstractPursuitLearnerNew.PartialMatch":
         """
         Compute the degree to which a meaning matches a perception.
         The resulting score should be between 0.0 (no match) and 1.0 (a perfect match)
+
+        If *min_match_ratio* is specified, implementations may stop searching
+        once no match that large is possible and report no match instead.
         """
 
     def templates_for_concept(self, concept: Concept) -> AbstractSet[SurfaceTemplate]:
@@ -1255,3 +1302,35 @@ class AbstractPursuitLearnerNew(AbstractTemplateLearnerNew, ABC):
                 concept=concept, pattern=pattern, match=match
             )
             yield match, semantic_node_for_match
+
+
+def _by_decreasing_score(
+    hypotheses_to_scores: Iterable[Mapping[PerceptionGraphTemplate, float]]
+) -> List[Tuple[PerceptionGraphTemplate, float]]:
+    """
+    Flattens the hypothesis scores of all learned items into one list,
+    sorted from highest to lowest score.
+    """
+    return sorted(
+        (
+            (hypothesis, score)
+            for h_to_s in hypotheses_to_scores
+            for (hypothesis, score) in h_to_s.items()
+        ),
+        key=lambda entry: entry[1],
+        reverse=True,
+    )
+
+
+def _drop_lowest_scoring_hypotheses(
+    hypotheses_to_scores: Dict[PerceptionGraphTemplate, float], *, keep: int
+) -> None:
+    """
+    Removes all but the *keep* highest-scoring entries of *hypotheses_to_scores* in place.
+    """
+    num_to_drop = len(hypotheses_to_scores) - keep
+    if num_to_drop > 0:
+        for hypothesis in nsmallest(
+            num_to_drop, hypotheses_to_scores, key=hypotheses_to_scores.__getitem__
+        ):
+            del hypotheses_to_scores[hypothesis]
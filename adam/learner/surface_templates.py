@@ -19,7 +19,7 @@ from immutablecollections.converter_utils import (
 from vistautils.span import Span
 
 
-@attrs(frozen=True, slots=True)
+@attrs(frozen=True, slots=True, cache_hash=True)
 class SurfaceTemplate:
     r"""
     A pattern over `TokenSequenceLinguisticDescription`\ s.
@@ -43,7 +43,9 @@ DISTAL = Distance("distal")
 Figure is "far" from the ground.
 """
 
-LANDAU_AND_JACKENDOFF_DISTANCES = [INTERIOR, EXTERIOR_BUT_IN_CONTACT, PROXIMAL, DISTAL]
+LANDAU_AND_JACKENDOFF_DISTANCES = immutableset(
+    [INTERIOR, EXTERIOR_BUT_IN_CONTACT, PROXIMAL, DISTAL]
+)
 """
 Distances used by Landau and Jackendoff in describing spatial relations.
 """
@@ -87,7 +89,7 @@ NewObjectT = TypeVar("NewObjectT")
 #             return self.name
 
 
-@attrs(frozen=True, repr=False)
+@attrs(frozen=True, slots=True, repr=False)
 class Direction(Generic[ReferenceObjectT]):
     r"""
     Represents the direction one object may have relative to another.
@@ -146,7 +148,7 @@ GRAVITATIONAL_DOWN = Direction(
 )
 
 
-@attrs(frozen=True, repr=False, cache_hash=True)
+@attrs(frozen=True, slots=True, repr=False, cache_hash=True)
 class Region(Generic[ReferenceObjectT]):
     """
     A region of space perceived by the learner.
@@ -258,7 +260,7 @@ FROM = PathOperator("from")
 AWAY_FROM = PathOperator("away-from")
 
 
-@attrs(frozen=True)
+@attrs(frozen=True, slots=True)
 class SpatialPath(Generic[ReferenceObjectT]):
     operator: Optional[PathOperator] = attrib(
         validator=optional(instance_of(PathOperator))
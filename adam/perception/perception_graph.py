@@ -13,6 +13,7 @@ and `PerceptionGraphPattern` before reading other parts of this module.
 import logging
 import pickle
 from abc import ABC, abstractmethod
+from collections import Counter
 from enum import Enum
 from itertools import chain, product, repeat
 from pathlib import Path
@@ -632,13 +633,28 @@ class PerceptionGraphPattern(PerceptionGraphProtocol, Sized, Iterable["NodePredi
         Compares two pattern graphs and returns true if they are isomorphic, including edges and
         node attributes.
         """
+        # Isomorphic patterns must have the same edge labels,
+        # so we can rule out most non-isomorphic pairs without running VF2.
+        if len(self) != len(other_graph):
+            return False
+        other_edge_label_counts = (
+            other_graph._edge_label_counts()  # pylint:disable=protected-access
+        )
+        if self._edge_label_counts() != other_edge_label_counts:
+            return False
         return is_isomorphic(
             self._graph,
-            other_graph.copy_as_digraph(),
+            other_graph._graph,  # pylint:disable=protected-access
             node_match=self._node_match,
             edge_match=self._edge_match,
         )
 
+    def _edge_label_counts(self) -> Counter:
+        return Counter(
+            predicate.dot_label()
+            for (_, _, predicate) in self._graph.edges(data="predicate")
+        )
+
     def matcher(
         self,
         graph_to_match_against: PerceptionGraphProtocol,
@@ -2506,11 +2522,21 @@ _PATTERN_PREDICATE_NODE_ORDER = [
     # so we search those last one the other nodes have established the skeleton of a match.
     AxisPredicate,
 ]
+_PATTERN_PREDICATE_NODE_TYPE_TO_POSITION = {  # type: ignore
+    node_type: position
+    for (position, node_type) in enumerate(_PATTERN_PREDICATE_NODE_ORDER)
+}
 
 
 def _pattern_matching_node_order(node_node_data_tuple) -> int:
     (node, _) = node_node_data_tuple
-    return _PATTERN_PREDICATE_NODE_ORDER.index(node.__class__)
+    position = _PATTERN_PREDICATE_NODE_TYPE_TO_POSITION.get(node.__class__)
+    if position is None:
+        raise RuntimeError(
+            f"Do not know how to order pattern node {node} of unexpected type "
+            f"{node.__class__.__name__} for matching"
+        )
+    return position
 
 
 # This is used to control the order in which pattern nodes are matched,
@@ -2528,6 +2554,9 @@ _GRAPH_NODE_ORDER = [  # type: ignore
     GeonAxis,
     CrossSection,
 ]
+_GRAPH_NODE_TYPE_TO_POSITION = {  # type: ignore
+    node_type: position for (position, node_type) in enumerate(_GRAPH_NODE_ORDER)
+}
 
 
 def _graph_node_order(node_node_data_tuple) -> int:
@@ -2538,7 +2567,13 @@ def _graph_node_order(node_node_data_tuple) -> int:
         # We need to unwrap these before comparing types.
         node = node[0]
 
-    return _GRAPH_NODE_ORDER.index(node.__class__)
+    position = _GRAPH_NODE_TYPE_TO_POSITION.get(node.__class__)
+    if position is None:
+        raise RuntimeError(
+            f"Do not know how to order graph node {node} of unexpected type "
+            f"{node.__class__.__name__} for matching"
+        )
+    return position
 
 
 GOVERNED = OntologyNode("governed")
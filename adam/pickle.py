@@ -1,12 +1,18 @@
 from adam.axis import GeonAxis
 from adam.learner.object_recognizer import SHARED_WORLD_ITEMS
 from adam.perception import ObjectPerception, GROUND_PERCEPTION, LEARNER_PERCEPTION
-from pickle import Pickler, Unpickler
+from pickle import HIGHEST_PROTOCOL, Pickler, Unpickler
+from typing import Optional
+from immutablecollections import immutabledict
 
 
 PERSISTENT_AXIS_TAG = "PersistentAxis"
 PERSISTENT_OBJECT_PERCEPTION_TAG = "PersistentObjectPerception"
 
+_SHARED_AXIS_NAME_TO_AXIS = immutabledict(
+    (item.debug_name, item) for item in SHARED_WORLD_ITEMS if isinstance(item, GeonAxis)
+)
+
 
 class AdamPickler(Pickler):
     """
@@ -14,8 +20,15 @@ class AdamPickler(Pickler):
 
     This pickler implements persistence logic for things that there should only be one of, like the
     ground, or the "gravitational up/down" axis.
+
+    Unless another *protocol* is requested, it uses the highest available pickle protocol.
     """
 
+    def __init__(
+        self, file, protocol: Optional[int] = HIGHEST_PROTOCOL, **kwargs
+    ) -> None:
+        super().__init__(file, protocol=protocol, **kwargs)
+
     @staticmethod
     def persistent_id(object_):
         persistent_id_ = None
@@ -49,10 +62,9 @@ class AdamUnpickler(Unpickler):
         tag = persistent_id[0]
         if tag == PERSISTENT_AXIS_TAG:
             name = persistent_id[1]
-            for axis in SHARED_WORLD_ITEMS:
-                # Check that the item is an axis before just to make sure
-                if isinstance(axis, GeonAxis) and axis.debug_name == name:
-                    return axis
+            axis = _SHARED_AXIS_NAME_TO_AXIS.get(name)
+            if axis is not None:
+                return axis
             raise RuntimeError(
                 f"Persistent axis found with name {name} but no such shared world item found!"
             )
@@ -1,6 +1,12 @@
+import pickle
+
 from networkx import DiGraph
 
-from adam.language.dependency import DependencyTree, DependencyTreeToken
+from adam.language.dependency import (
+    DependencyTree,
+    DependencyTreeToken,
+    RoleOrderDependencyTreeLinearizer,
+)
 from adam.language.dependency.universal_dependencies import (
     ADPOSITION,
     CASE_SPATIAL,
@@ -12,12 +18,16 @@ from adam.language.dependency.universal_dependencies import (
     OBLIQUE_NOMINAL,
     VERB,
 )
+from adam.language_specific.english.english_language_generator import (
+    GAILA_PHASE_1_LANGUAGE_GENERATOR,
+)
 from adam.language_specific.english.english_syntax import (
     SIMPLE_ENGLISH_DEPENDENCY_TREE_LINEARIZER,
+    _ENGLISH_HEAD_TO_ROLE_ORDER,
 )
 
 
-def test_mom_put_the_ball_on_the_table():
+def _mom_put_the_ball_on_the_table_tree() -> DependencyTree:
     mom = DependencyTreeToken("Mom", NOUN)
     put = DependencyTreeToken("put", VERB)
     the_0 = DependencyTreeToken("the", DETERMINER)
@@ -33,11 +43,41 @@ def test_mom_put_the_ball_on_the_table():
     tree.add_edge(on, table, role=CASE_SPATIAL)
     tree.add_edge(the_1, table, role=DETERMINER_ROLE)
     tree.add_edge(table, put, role=OBLIQUE_NOMINAL)
+    return DependencyTree(tree)
 
+
+def test_mom_put_the_ball_on_the_table():
     predicted_token_order = tuple(
         node.token
         for node in SIMPLE_ENGLISH_DEPENDENCY_TREE_LINEARIZER.linearize(
-            DependencyTree(tree)
+            _mom_put_the_ball_on_the_table_tree()
         ).surface_token_order
     )
     assert predicted_token_order == ("Mom", "put", "the", "ball", "on", "the", "table")
+
+
+def test_linearizer_equality():
+    assert SIMPLE_ENGLISH_DEPENDENCY_TREE_LINEARIZER == RoleOrderDependencyTreeLinearizer(
+        _ENGLISH_HEAD_TO_ROLE_ORDER
+    )
+
+
+def test_pickle_linearizer():
+    unpickled_linearizer = pickle.loads(
+        pickle.dumps(SIMPLE_ENGLISH_DEPENDENCY_TREE_LINEARIZER)
+    )
+    assert unpickled_linearizer == SIMPLE_ENGLISH_DEPENDENCY_TREE_LINEARIZER
+    assert unpickled_linearizer.linearize(
+        _mom_put_the_ball_on_the_table_tree()
+    ).as_token_sequence() == ("Mom", "put", "the", "ball", "on", "the", "table")
+
+
+def test_pickle_language_generator():
+    # language generators are held by generated curricula, which experiments pickle
+    unpickled_language_generator = pickle.loads(
+        pickle.dumps(GAILA_PHASE_1_LANGUAGE_GENERATOR)
+    )
+    assert (
+        unpickled_language_generator._dependency_tree_linearizer  # pylint:disable=protected-access
+        == SIMPLE_ENGLISH_DEPENDENCY_TREE_LINEARIZER
+    )
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from adam.curriculum.pursuit_curriculum import make_simple_pursuit_curriculum
+from adam.language.language_utils import phase1_language_generator
+from adam.learner import LearningExample
+from adam.learner.integrated_learner import IntegratedTemplateLearner
+from adam.learner.language_mode import LanguageMode
+from adam.learner.objects import PursuitObjectLearnerNew
+from adam.learner.pursuit import _drop_lowest_scoring_hypotheses
+from adam.ontology.phase1_ontology import BALL, BOX, DOG, GAILA_PHASE_1_ONTOLOGY
+
+
+def test_drop_lowest_scoring_hypotheses():
+    hypotheses_to_scores = {"a": 0.5, "b": 0.1, "c": 0.9, "d": 0.3}
+    _drop_lowest_scoring_hypotheses(hypotheses_to_scores, keep=2)
+    assert hypotheses_to_scores == {"a": 0.5, "c": 0.9}
+
+
+@pytest.mark.parametrize("keep", [3, 4])
+def test_drop_lowest_scoring_hypotheses_within_bound(keep):
+    hypotheses_to_scores = {"a": 0.5, "b": 0.1, "c": 0.9}
+    _drop_lowest_scoring_hypotheses(hypotheses_to_scores, keep=keep)
+    assert hypotheses_to_scores == {"a": 0.5, "b": 0.1, "c": 0.9}
+
+
+def test_drop_lowest_scoring_hypotheses_keep_one():
+    hypotheses_to_scores = {"a": 0.5, "b": 0.1, "c": 0.9}
+    _drop_lowest_scoring_hypotheses(hypotheses_to_scores, keep=1)
+    assert hypotheses_to_scores == {"c": 0.9}
+
+
+def _observe_pursuit_curriculum(*, max_hypotheses_per_item):
+    """
+    Trains a pursuit object learner and returns the largest number of hypotheses
+    it held for any concept after any learning step.
+    """
+    language_mode = LanguageMode.ENGLISH
+    train_curriculum = make_simple_pursuit_curriculum(
+        target_objects=[BALL, DOG, BOX],
+        num_instances=10,
+        num_objects_in_instance=3,
+        num_noise_instances=0,
+        language_generator=phase1_language_generator(language_mode),
+    )
+    rng = random.Random()
+    rng.seed(0)
+    object_learner = PursuitObjectLearnerNew(
+        learning_factor=0.05,
+        graph_match_confirmation_threshold=0.7,
+        lexicon_entry_threshold=0.7,
+        rng=rng,
+        smoothing_parameter=0.002,
+        ontology=GAILA_PHASE_1_ONTOLOGY,
+        language_mode=language_mode,
+        max_hypotheses_per_item=max_hypotheses_per_item,
+    )
+    learner = IntegratedTemplateLearner(object_learner=object_learner)
+
+    most_hypotheses_for_a_concept = 0
+    for (
+        _,
+        linguistic_description,
+        perceptual_representation,
+    ) in train_curriculum.instances():
+        learner.observe(
+            LearningExample(perceptual_representation, linguistic_description)
+        )
+        concept_to_hypotheses_and_scores = (
+            object_learner._concept_to_hypotheses_and_scores  # pylint:disable=protected-access
+        )
+        for hypotheses_to_scores in concept_to_hypotheses_and_scores.values():
+            most_hypotheses_for_a_concept = max(
+                most_hypotheses_for_a_concept, len(hypotheses_to_scores)
+            )
+    return most_hypotheses_for_a_concept
+
+
+def test_pursuit_learner_max_hypotheses_per_item():
+    max_hypotheses_per_item = 2
+    # without a bound, this curriculum gives some concept more hypotheses than the bound,
+    # so the check below really exercises dropping hypotheses
+    assert (
+        _observe_pursuit_curriculum(max_hypotheses_per_item=None)
+        > max_hypotheses_per_item
+    )
+    assert (
+        _observe_pursuit_curriculum(max_hypotheses_per_item=max_hypotheses_per_item)
+        <= max_hypotheses_per_item
+    )
+
+
+def test_pursuit_object_learner_drops_observation_cache():
+    language_mode = LanguageMode.ENGLISH
+    train_curriculum = make_simple_pursuit_curriculum(
+        target_objects=[BALL, DOG],
+        num_instances=2,
+        num_objects_in_instance=2,
+        num_noise_instances=0,
+        language_generator=phase1_language_generator(language_mode),
+    )
+    object_learner = PursuitObjectLearnerNew(
+        learning_factor=0.05,
+        graph_match_confirmation_threshold=0.7,
+        lexicon_entry_threshold=0.7,
+        rng=random.Random(0),
+        smoothing_parameter=0.002,
+        ontology=GAILA_PHASE_1_ONTOLOGY,
+        language_mode=language_mode,
+    )
+    learner = IntegratedTemplateLearner(object_learner=object_learner)
+    for (
+        _,
+        linguistic_description,
+        perceptual_representation,
+    ) in train_curriculum.instances():
+        learner.observe(
+            LearningExample(perceptual_representation, linguistic_description)
+        )
+        # the candidate hypotheses cached for an observation
+        # must not outlive learning from it
+        assert (
+            object_learner._perception_graph_to_hypotheses  # pylint:disable=protected-access
+            is None
+        )
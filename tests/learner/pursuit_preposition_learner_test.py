@@ -57,27 +57,24 @@ def pursuit_learner_factory(language_mode: LanguageMode):
     )
 
 
-@pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
-@pytest.mark.parametrize("learner", [pursuit_learner_factory])
-def test_pursuit_preposition_on_learner(language_mode, learner):
-    ball = standard_object("ball", BALL)
-    table = standard_object("table", TABLE)
-    language_generator = phase1_language_generator(language_mode)
-    on_train_curriculum = phase1_instances(
+def run_preposition_test(
+    learner, train_template, test_template, language_generator, *, max_to_train=10
+):
+    train_curriculum = phase1_instances(
         "Preposition Unit Train",
         situations=sampled(
-            _on_template(ball, table, immutableset(), is_training=True),
+            train_template,
             chooser=PHASE1_CHOOSER_FACTORY(),
             ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=10,
+            max_to_sample=max_to_train,
             block_multiple_of_the_same_type=True,
         ),
         language_generator=language_generator,
     )
-    on_test_curriculum = phase1_instances(
+    test_curriculum = phase1_instances(
         "Preposition Unit Test",
         situations=sampled(
-            _on_template(ball, table, immutableset(), is_training=False),
+            test_template,
             chooser=PHASE1_CHOOSER_FACTORY(),
             ontology=GAILA_PHASE_1_ONTOLOGY,
             max_to_sample=1,
@@ -86,85 +83,52 @@ def test_pursuit_preposition_on_learner(language_mode, learner):
         language_generator=language_generator,
     )
 
-    processing_learner = learner(language_mode)
-
     for (
         _,
         linguistic_description,
         perceptual_representation,
-    ) in on_train_curriculum.instances():
-        # Get the object matches first - preposition learner can't learn without already recognized objects
-        processing_learner.observe(
+    ) in train_curriculum.instances():
+        learner.observe(
             LearningExample(perceptual_representation, linguistic_description)
         )
+
     for (
         _,
-        test_lingustics_description,
+        test_linguistic_description,
         test_perceptual_representation,
-    ) in on_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_lingustics_description.as_token_sequence()
+    ) in test_curriculum.instances():
+        descriptions_from_learner = learner.describe(test_perceptual_representation)
+        gold = test_linguistic_description.as_token_sequence()
         assert descriptions_from_learner
         assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
 
 
 @pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
 @pytest.mark.parametrize("learner", [pursuit_learner_factory])
-def test_pursuit_preposition_beside_learner(language_mode, learner):
-    language_generator = phase1_language_generator(language_mode)
+def test_pursuit_preposition_on_learner(language_mode, learner):
     ball = standard_object("ball", BALL)
     table = standard_object("table", TABLE)
-    beside_train_curriculum = phase1_instances(
-        "Preposition Beside Unit Train",
-        situations=sampled(
-            _beside_template(
-                ball, table, immutableset(), is_training=True, is_right=True
-            ),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=10,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-    beside_test_curriculum = phase1_instances(
-        "Preposition Beside Unit Test",
-        situations=sampled(
-            _beside_template(
-                ball, table, immutableset(), is_training=False, is_right=True
-            ),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=1,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
+
+    run_preposition_test(
+        learner(language_mode),
+        _on_template(ball, table, immutableset(), is_training=True),
+        _on_template(ball, table, immutableset(), is_training=False),
+        language_generator=phase1_language_generator(language_mode),
     )
 
-    processing_learner = learner(language_mode)
 
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in beside_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
+@pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
+@pytest.mark.parametrize("learner", [pursuit_learner_factory])
+def test_pursuit_preposition_beside_learner(language_mode, learner):
+    ball = standard_object("ball", BALL)
+    table = standard_object("table", TABLE)
 
-    for (
-        _,
-        test_linguistic_description,
-        test_perceptual_representation,
-    ) in beside_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_linguistic_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_preposition_test(
+        learner(language_mode),
+        _beside_template(ball, table, immutableset(), is_training=True, is_right=True),
+        _beside_template(ball, table, immutableset(), is_training=False, is_right=True),
+        language_generator=phase1_language_generator(language_mode),
+    )
 
 
 @pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
@@ -172,56 +136,13 @@ def test_pursuit_preposition_beside_learner(language_mode, learner):
 def test_pursuit_preposition_under_learner(language_mode, learner):
     ball = standard_object("ball", BALL)
     table = standard_object("table", TABLE)
-    language_generator = phase1_language_generator(language_mode)
-    under_train_curriculum = phase1_instances(
-        "Preposition Under Unit Train",
-        situations=sampled(
-            _under_template(
-                ball, table, immutableset(), is_training=True, is_distal=True
-            ),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=10,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-    under_test_curriculum = phase1_instances(
-        "Preposition Under Unit Test",
-        situations=sampled(
-            _under_template(
-                ball, table, immutableset(), is_training=False, is_distal=True
-            ),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=1,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
 
-    processing_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in under_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
-
-    for (
-        _,
-        test_linguistic_description,
-        test_perceptual_representation,
-    ) in under_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_linguistic_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_preposition_test(
+        learner(language_mode),
+        _under_template(ball, table, immutableset(), is_training=True, is_distal=True),
+        _under_template(ball, table, immutableset(), is_training=False, is_distal=True),
+        language_generator=phase1_language_generator(language_mode),
+    )
 
 
 @pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
@@ -229,54 +150,13 @@ def test_pursuit_preposition_under_learner(language_mode, learner):
 def test_pursuit_preposition_over_learner(language_mode, learner):
     ball = standard_object("ball", BALL)
     table = standard_object("table", TABLE)
-    language_generator = phase1_language_generator(language_mode)
-    over_train_curriculum = phase1_instances(
-        "Preposition Over Unit Train",
-        situations=sampled(
-            _over_template(ball, table, immutableset(), is_training=True, is_distal=True),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=10,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-    over_test_curriculum = phase1_instances(
-        "Preposition Over Unit Test",
-        situations=sampled(
-            _over_template(
-                ball, table, immutableset(), is_training=False, is_distal=True
-            ),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=1,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
 
-    processing_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in over_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
-
-    for (
-        _,
-        test_linguistic_description,
-        test_perceptual_representation,
-    ) in over_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_linguistic_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_preposition_test(
+        learner(language_mode),
+        _over_template(ball, table, immutableset(), is_training=True, is_distal=True),
+        _over_template(ball, table, immutableset(), is_training=False, is_distal=True),
+        language_generator=phase1_language_generator(language_mode),
+    )
 
 
 @pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
@@ -284,52 +164,13 @@ def test_pursuit_preposition_over_learner(language_mode, learner):
 def test_pursuit_preposition_in_learner(language_mode, learner):
     water = object_variable("water", WATER)
     cup = standard_object("cup", CUP)
-    language_generator = phase1_language_generator(language_mode)
-    in_train_curriculum = phase1_instances(
-        "Preposition In Unit Train",
-        situations=sampled(
-            _in_template(water, cup, immutableset(), is_training=True),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=10,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-    in_test_curriculum = phase1_instances(
-        "Preposition In Unit Test",
-        situations=sampled(
-            _in_template(water, cup, immutableset(), is_training=False),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=1,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-
-    processing_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in in_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
 
-    for (
-        _,
-        test_linguistic_description,
-        test_perceptual_representation,
-    ) in in_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_linguistic_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_preposition_test(
+        learner(language_mode),
+        _in_template(water, cup, immutableset(), is_training=True),
+        _in_template(water, cup, immutableset(), is_training=False),
+        language_generator=phase1_language_generator(language_mode),
+    )
 
 
 @pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
@@ -337,53 +178,14 @@ def test_pursuit_preposition_in_learner(language_mode, learner):
 def test_pursuit_preposition_behind_learner(language_mode, learner):
     ball = standard_object("ball", BALL)
     table = standard_object("table", TABLE)
-    language_generator = phase1_language_generator(language_mode)
     speaker = standard_object("speaker", MOM, added_properties=[IS_SPEAKER])
-    behind_train_curriculum = phase1_instances(
-        "Preposition Behind Unit Train",
-        situations=sampled(
-            _behind_template(ball, table, [speaker], is_training=True, is_near=True),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=10,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-    behind_test_curriculum = phase1_instances(
-        "Preposition Behind Unit Test",
-        situations=sampled(
-            _behind_template(ball, table, [speaker], is_training=False, is_near=True),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=1,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-
-    processing_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in behind_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
 
-    for (
-        _,
-        test_linguistic_description,
-        test_perceptual_representation,
-    ) in behind_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_linguistic_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_preposition_test(
+        learner(language_mode),
+        _behind_template(ball, table, [speaker], is_training=True, is_near=True),
+        _behind_template(ball, table, [speaker], is_training=False, is_near=True),
+        language_generator=phase1_language_generator(language_mode),
+    )
 
 
 @pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
@@ -391,53 +193,14 @@ def test_pursuit_preposition_behind_learner(language_mode, learner):
 def test_pursuit_preposition_in_front_learner(language_mode, learner):
     ball = standard_object("ball", BALL)
     table = standard_object("table", TABLE)
-    language_generator = phase1_language_generator(language_mode)
     speaker = standard_object("speaker", MOM, added_properties=[IS_SPEAKER])
-    in_front_train_curriculum = phase1_instances(
-        "Preposition In Front Unit Train",
-        situations=sampled(
-            _in_front_template(ball, table, [speaker], is_training=True, is_near=True),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=10,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-    in_front_test_curriculum = phase1_instances(
-        "Preposition In Front Unit Test",
-        situations=sampled(
-            _in_front_template(ball, table, [speaker], is_training=False, is_near=True),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=1,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-
-    processing_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in in_front_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
 
-    for (
-        _,
-        test_linguistic_description,
-        test_perceptual_representation,
-    ) in in_front_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_linguistic_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_preposition_test(
+        learner(language_mode),
+        _in_front_template(ball, table, [speaker], is_training=True, is_near=True),
+        _in_front_template(ball, table, [speaker], is_training=False, is_near=True),
+        language_generator=phase1_language_generator(language_mode),
+    )
 
 
 @pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
@@ -451,51 +214,10 @@ def test_pursuit_preposition_has_learner(language_mode, learner):
     )
     ball = standard_object("ball", BALL)
 
-    language_generator = phase1_language_generator(language_mode)
-
-    has_train_curriculum = phase1_instances(
-        "Has Unit Train",
-        situations=sampled(
-            _x_has_y_template(person, inanimate_object),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=2,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
+    run_preposition_test(
+        learner(language_mode),
+        _x_has_y_template(person, inanimate_object),
+        _x_has_y_template(person, ball),
+        language_generator=phase1_language_generator(language_mode),
+        max_to_train=2,
     )
-
-    has_test_curriculum = phase1_instances(
-        "Has Unit Test",
-        situations=sampled(
-            _x_has_y_template(person, ball),
-            chooser=PHASE1_CHOOSER_FACTORY(),
-            ontology=GAILA_PHASE_1_ONTOLOGY,
-            max_to_sample=1,
-            block_multiple_of_the_same_type=True,
-        ),
-        language_generator=language_generator,
-    )
-
-    processing_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in has_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
-
-    for (
-        _,
-        test_lingustics_description,
-        test_perceptual_representation,
-    ) in has_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_lingustics_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
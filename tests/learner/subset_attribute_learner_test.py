@@ -1,5 +1,3 @@
-from itertools import chain
-
 import pytest
 from more_itertools import flatten
 
@@ -61,6 +59,27 @@ def integrated_learner_factory(language_mode: LanguageMode):
     )
 
 
+def run_attribute_test(learner, train_curriculum, test_curriculum):
+    for (
+        _,
+        linguistic_description,
+        perceptual_representation,
+    ) in train_curriculum.instances():
+        learner.observe(
+            LearningExample(perceptual_representation, linguistic_description)
+        )
+
+    for (
+        _,
+        test_linguistic_description,
+        test_perceptual_representation,
+    ) in test_curriculum.instances():
+        descriptions_from_learner = learner.describe(test_perceptual_representation)
+        gold = test_linguistic_description.as_token_sequence()
+        assert descriptions_from_learner
+        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+
+
 # TODO: fix https://github.com/isi-vista/adam/issues/917 which causes us to have to specify that we don't wish to include ME_HACK and YOU_HACK in our curriculum design
 
 
@@ -105,21 +124,15 @@ def test_subset_color_attribute(
     color_train_curriculum = phase1_instances(
         f"{color.handle} Color Train",
         language_generator=language_generator,
-        situations=chain(
-            *[
-                flatten(
-                    [
-                        sampled(
-                            template,
-                            chooser=PHASE1_CHOOSER_FACTORY(),
-                            ontology=GAILA_PHASE_1_ONTOLOGY,
-                            max_to_sample=2,
-                            block_multiple_of_the_same_type=True,
-                        )
-                        for template in templates
-                    ]
-                )
-            ]
+        situations=flatten(
+            sampled(
+                template,
+                chooser=PHASE1_CHOOSER_FACTORY(),
+                ontology=GAILA_PHASE_1_ONTOLOGY,
+                max_to_sample=2,
+                block_multiple_of_the_same_type=True,
+            )
+            for template in templates
         ),
     )
 
@@ -135,28 +148,9 @@ def test_subset_color_attribute(
         language_generator=language_generator,
     )
 
-    processing_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in color_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
-
-    for (
-        _,
-        test_lingustics_description,
-        test_perceptual_representation,
-    ) in color_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_lingustics_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_attribute_test(
+        learner(language_mode), color_train_curriculum, color_test_curriculum
+    )
 
 
 # hack: wo de and ni de are currently considered to be one word. This won't work for third person possession
@@ -219,28 +213,7 @@ def test_subset_my_attribute_learner_integrated(language_mode, learner):
         language_generator=language_generator,
     )
 
-    processing_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in my_train_curriculum.instances():
-        processing_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
-
-    for (
-        _,
-        test_lingustics_description,
-        test_perceptual_representation,
-    ) in my_test_curriculum.instances():
-        descriptions_from_learner = processing_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_lingustics_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_attribute_test(learner(language_mode), my_train_curriculum, my_test_curriculum)
 
 
 @pytest.mark.parametrize("language_mode", [LanguageMode.ENGLISH, LanguageMode.CHINESE])
@@ -307,25 +280,6 @@ def test_your_attribute_learner(language_mode, learner):
         language_generator=language_generator,
     )
 
-    process_learner = learner(language_mode)
-
-    for (
-        _,
-        linguistic_description,
-        perceptual_representation,
-    ) in your_train_curriculum.instances():
-        process_learner.observe(
-            LearningExample(perceptual_representation, linguistic_description)
-        )
-
-    for (
-        _,
-        test_lingustics_description,
-        test_perceptual_representation,
-    ) in your_test_curriculum.instances():
-        descriptions_from_learner = process_learner.describe(
-            test_perceptual_representation
-        )
-        gold = test_lingustics_description.as_token_sequence()
-        assert descriptions_from_learner
-        assert gold in [desc.as_token_sequence() for desc in descriptions_from_learner]
+    run_attribute_test(
+        learner(language_mode), your_train_curriculum, your_test_curriculum
+    )